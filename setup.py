@@ -0,0 +1,10 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Builds the optional C fast path for kvlm_parse:
+#     python setup.py build_ext --inplace
+# libwyag works without it, falling back to the pure-Python parser.
+setup(
+    name="wyag",
+    ext_modules=cythonize("_kvlm.pyx"),
+)